@@ -3,103 +3,292 @@
 # Date: 2025-03-23
 # Purpose: Create an analog clock with real-time weather integration and date display.
 # Features: 
-# - Smooth second hand movement
+# - Sweeping second hand that steps in whole degrees (6 steps per second)
 # - Date and weather display
 # - Automatic theme switching (light/dark mode)
 # ===========================================================
 
 import pygame
 import pygame.gfxdraw
-from datetime import datetime
+import asyncio
+import contextlib
+import json
+import logging
 import math
+import os
+import re
+import threading
+import time
+from collections import OrderedDict, namedtuple
 import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+from email.utils import parsedate_to_datetime
+
+# Colors used to draw the clock, as attributes for fast access in the render loop
+Theme = namedtuple("Theme", "background face_outer face_middle face_inner hand_hour hand_minute hand_second mark_color shadow text_color")
 
 # Define the light and dark themes for the clock
 THEMES = {
-    "light": {  # Light theme colors
-        "background": (225, 239, 240),
-        "face_outer": (45, 45, 45),
-        "face_middle": (229, 229, 229),
-        "face_inner": (255, 255, 255),
-        "hand_hour": (45, 45, 45),
-        "hand_minute": (45, 45, 45),
-        "hand_second": (255, 0, 0),
-        "mark_color": (45, 45, 45),
-        "shadow": (0, 0, 0, 50),
-        "text_color": (0, 0, 0)
-    },
-    "dark": {  # Dark theme colors
-        "background": (30, 30, 30),
-        "face_outer": (100, 100, 100),
-        "face_middle": (70, 70, 70),
-        "face_inner": (50, 50, 50),
-        "hand_hour": (255, 255, 255),
-        "hand_minute": (200, 200, 200),
-        "hand_second": (255, 69, 0),
-        "mark_color": (255, 255, 255),
-        "shadow": (0, 0, 0, 80),
-        "text_color": (255, 255, 255)
-    }
+    "light": Theme(  # Light theme colors
+        background=(225, 239, 240),
+        face_outer=(45, 45, 45),
+        face_middle=(229, 229, 229),
+        face_inner=(255, 255, 255),
+        hand_hour=(45, 45, 45),
+        hand_minute=(45, 45, 45),
+        hand_second=(255, 0, 0),
+        mark_color=(45, 45, 45),
+        shadow=(0, 0, 0, 50),
+        text_color=(0, 0, 0)
+    ),
+    "dark": Theme(  # Dark theme colors
+        background=(30, 30, 30),
+        face_outer=(100, 100, 100),
+        face_middle=(70, 70, 70),
+        face_inner=(50, 50, 50),
+        hand_hour=(255, 255, 255),
+        hand_minute=(200, 200, 200),
+        hand_second=(255, 69, 0),
+        mark_color=(255, 255, 255),
+        shadow=(0, 0, 0, 80),
+        text_color=(255, 255, 255)
+    )
 }
 
+logger = logging.getLogger(__name__)
+
+# Shortest time a weather response is reused, even if the server says it is already stale
+WEATHER_MIN_TTL_SEC = 60
+
+# Delay before retrying a failed weather fetch, doubled after each consecutive failure
+WEATHER_BACKOFF_MIN_SEC = 60
+WEATHER_BACKOFF_MAX_SEC = 3600
+
+# Number of rotated hour/minute hand sprites kept around; the second hand is rotated on the fly
+ROTATION_CACHE_SIZE = 8
+
+# File the last weather response is saved to, so restarts can show it without waiting for the network
+WEATHER_CACHE_FILE = os.path.join(os.path.expanduser("~"), ".cache", "analog_clock", "weather.json")
+
+# Shared HTTP session so weather refreshes reuse the same keep-alive connection
+_SESSION = requests.Session()
+_SESSION.mount("https://", HTTPAdapter(pool_connections=1, pool_maxsize=1, max_retries=Retry(total=2, backoff_factor=0.3)))
+
+def _parse_max_age(headers):
+    """
+    Get how many seconds a response stays fresh from its Cache-Control or Expires header, or None if neither is usable.
+    """
+    match = re.search(r"max-age=(\d+)", headers.get("Cache-Control", ""))
+    if match:
+        return int(match.group(1))
+    try:
+        expires = parsedate_to_datetime(headers["Expires"])  # Absolute expiry time sent by the server
+        return max(0.0, expires.timestamp() - time.time())
+    except (KeyError, TypeError, ValueError):
+        return None  # No Expires header, or one we can't parse
+
 # Class representing the Analog Clock
 class AnalogClock:
-    def __init__(self, size, position):
+    def __init__(self, size, position, cache_ttl_sec=600):
         """
         Initialize the AnalogClock with the specified size and position.
+        Weather responses are reused for cache_ttl_sec seconds before being fetched again.
         """
         self.size = size  # Clock size
         self.position = position  # Position of the clock center
+        self._hour_mark_offsets = tuple(  # Start and end offsets of the 12 hour marks, relative to the clock center
+            (((size - 20) * math.cos(a), -(size - 20) * math.sin(a)), ((size - 40) * math.cos(a), -(size - 40) * math.sin(a)))
+            for a in (math.radians(i * 30) for i in range(12))  # 30 degree angle per hour
+        )
+        self._hand_directions = tuple(  # Unit vector from the center towards each whole-degree clock angle
+            (math.sin(a), -math.cos(a)) for a in (math.radians(d) for d in range(360))
+        )
         self.hour = 0  # Hour hand angle
         self.minute = 0  # Minute hand angle
         self.second = 0  # Second hand angle
-        self.milliseconds = 0  # Milliseconds for smooth second hand movement
+        self.milliseconds = 0  # Milliseconds for sub-second second hand movement
         self.font = pygame.font.Font(None, 36)  # Font for displaying date and weather
         self.weather = "Fetching..."  # Initial weather message
-        self.update_weather()  # Update the weather info immediately
+        self._weather_lock = threading.Lock()  # Guards self.weather between the fetch thread and the render loop
+        self.cache_ttl_sec = cache_ttl_sec  # How long a fetched weather response stays fresh
+        self._cached_weather = self.weather  # Text of the last successful fetch
+        self._weather_expires = 0.0  # Monotonic time after which the cached weather must be fetched again
+        self._weather_headers = {}  # Conditional request headers built from the last response's ETag and Last-Modified
+        self._backoff = WEATHER_BACKOFF_MIN_SEC  # Delay before retrying after the next failed fetch
+        self._next_attempt = 0.0  # Monotonic time before which no fetch is attempted after a failure
+        self._fetch_in_progress = False  # Set while a fetch thread is running, so only one runs at a time
+        self.__load_weather_cache()  # Reuse the weather saved by a previous run if it is still fresh
+        self._face_cache = {}  # Pre-rendered clock face surfaces, keyed by theme name
+        self._info_cache = (None, None)  # Last rendered info panel as (key, surface)
+        self._hand_surfaces = {}  # Unrotated (hand, shadow) sprites, keyed by (hand, color, shadow color)
+        self._rot_cache = OrderedDict()  # Recently used rotated (hand, shadow) sprites, keyed by (hand, color, shadow color, integer degrees)
+        self._last_hour = None  # 24-hour value the theme was last chosen for
+        self._last_yday = None  # Day of the year the date string was last formatted for
+        self._theme_name = None  # Name of the current theme
+        self._theme = None  # Current theme colors
     
     def update(self):
         """
         Update the time, second, and date to show the current time.
         """
-        now = datetime.now()  # Get current date and time
-        self.hour = now.hour % 12  # 12-hour format
-        self.minute = now.minute  # Get current minute
-        self.second = now.second + now.microsecond / 1_000_000  # Smooth second hand movement with microseconds
-        self.current_date = now.strftime("%A, %B %d, %Y")  # Format the current date as 'Day, Month Date, Year'
+        t = time.time()  # Get current time in seconds since the epoch
+        now = time.localtime(t)  # Break it down into local date and time fields
+        self.hour = now.tm_hour % 12  # 12-hour format
+        self.minute = now.tm_min  # Get current minute
+        self.second = now.tm_sec + (t - int(t))  # Fractional second, rounded to whole degrees when drawn
+        if now.tm_yday != self._last_yday:  # The date string only changes once per day
+            self.current_date = time.strftime("%A, %B %d, %Y", now)  # Format the current date as 'Day, Month Date, Year'
+            self._last_yday = now.tm_yday
+        if now.tm_hour != self._last_hour:  # The theme can only change when the hour does
+            self._theme_name = "dark" if 18 <= now.tm_hour or now.tm_hour < 6 else "light"  # Dark theme at night (6 PM - 6 AM), light theme during the day
+            self._theme = THEMES[self._theme_name]
+            self._last_hour = now.tm_hour
     
+    def get_frame_key(self):
+        """
+        Get a key describing everything visible on screen, so unchanged frames can be skipped.
+        """
+        with self._weather_lock:
+            weather = self.weather
+        return (int(round(self.second * 6)) % 360, self.minute, self.hour, self.current_date, weather)  # Second hand quantized to whole degrees, as it is drawn
+
+    def get_seconds_until_next_frame(self):
+        """
+        Get how long until the drawn second hand moves to its next whole degree, as of the last update.
+        """
+        step = 1 / 6  # The second hand moves one degree every sixth of a second
+        remaining = step - (self.second + step / 2) % step  # Rounding to whole degrees moves the change halfway between steps
+        return remaining + 0.001  # Wake just past the change rather than exactly on it
+
     def update_weather(self):
+        """
+        Refresh the weather in a background thread so the render loop never blocks on the network.
+        Returns the cached weather immediately if it is still fresh.
+        """
+        with self._weather_lock:
+            now = time.monotonic()
+            if now < self._weather_expires:
+                return self._cached_weather  # Cache hit, no request needed
+            if now < self._next_attempt:
+                return self.weather  # Still backing off after a failed fetch
+            if self._fetch_in_progress:
+                return self.weather  # A previous fetch is still running
+            self._fetch_in_progress = True  # Claimed under the lock, so two callers can't both start a fetch
+        threading.Thread(target=self.__run_fetch, daemon=True).start()  # Daemon thread won't keep the program alive on exit
+        return self.weather
+
+    def __run_fetch(self):
+        """
+        Fetch the weather, then allow the next fetch to start whatever the outcome.
+        """
+        try:
+            self._fetch_weather()
+        finally:
+            with self._weather_lock:
+                self._fetch_in_progress = False
+
+    def _fetch_weather(self):
         """
         Fetch the current weather from an online API.
         """
+        with self._weather_lock:
+            headers = dict(self._weather_headers)  # Ask the server to skip the body if the weather hasn't changed
         try:
             # Request the weather data from a weather service
-            response = requests.get("https://wttr.in/?format=%t+%C")
-            if response.status_code == 200:
-                self.weather = response.text.strip()  # If successful, get the weather status
-        except:
-            self.weather = "Weather unavailable"  # If there is an error, display "Weather unavailable"
+            response = _SESSION.get("https://wttr.in/?format=%t+%C", headers=headers, timeout=3)
+        except requests.RequestException as e:
+            logger.warning("Weather fetch failed: %s", e)
+            self.__schedule_retry("Weather unavailable")  # If there is an error, display "Weather unavailable"
+            return
+        if response.status_code not in (200, 304):
+            logger.warning("Weather fetch returned HTTP %d", response.status_code)
+            self.__schedule_retry()  # Keep the previous weather message
+            return
+        max_age = _parse_max_age(response.headers)  # Let the server decide how long the response stays fresh
+        with self._weather_lock:
+            if response.status_code == 304:  # Not modified, the cached weather is still current
+                weather = self._cached_weather
+            else:
+                weather = response.text.strip()  # If successful, get the weather status
+                self._weather_headers = {}
+                if "ETag" in response.headers:
+                    self._weather_headers["If-None-Match"] = response.headers["ETag"]
+                if "Last-Modified" in response.headers:
+                    self._weather_headers["If-Modified-Since"] = response.headers["Last-Modified"]
+            self.weather = weather
+            self._backoff = WEATHER_BACKOFF_MIN_SEC  # Reset the backoff after a success
+            self._cached_weather = weather
+            expires_in = self.cache_ttl_sec if max_age is None else max(max_age, WEATHER_MIN_TTL_SEC)  # Fall back to our own TTL without cache headers
+            self._weather_expires = time.monotonic() + expires_in
+        self.__save_weather_cache(weather, expires_in)
+
+    def __schedule_retry(self, weather=None):
+        """
+        Delay the next fetch after a failure, doubling the delay each time, and optionally replace the weather message.
+        """
+        with self._weather_lock:
+            if weather is not None:
+                self.weather = weather
+            self._next_attempt = time.monotonic() + self._backoff
+            self._backoff = min(self._backoff * 2, WEATHER_BACKOFF_MAX_SEC)
+
+    def __load_weather_cache(self):
+        """
+        Load the weather saved by a previous run, ignoring it if it has expired or can't be read.
+        """
+        try:
+            with open(WEATHER_CACHE_FILE, encoding="utf-8") as f:
+                cached = json.load(f)
+            expires_in = cached["expires"] - time.time()  # The file stores wall-clock times, monotonic ones don't survive a restart
+            weather = cached["value"]
+        except (OSError, ValueError, KeyError, TypeError):
+            return
+        if expires_in > 0:
+            self.weather = weather
+            self._cached_weather = weather
+            self._weather_expires = time.monotonic() + expires_in
+
+    def __save_weather_cache(self, weather, expires_in):
+        """
+        Save the weather to disk so the next run can show it immediately.
+        """
+        now = time.time()
+        try:
+            os.makedirs(os.path.dirname(WEATHER_CACHE_FILE), exist_ok=True)
+            tmp_path = WEATHER_CACHE_FILE + ".tmp"
+            with open(tmp_path, "w", encoding="utf-8") as f:
+                json.dump({"expires": now + expires_in, "value": weather}, f)
+            os.replace(tmp_path, WEATHER_CACHE_FILE)  # Atomic, so a reader never sees a half-written file
+        except OSError:
+            pass  # The disk cache is only an optimization
     
+    def get_theme_name(self):
+        """
+        Get the name of the theme chosen for the time of the last update.
+        """
+        return self._theme_name
+
     def get_theme(self):
         """
-        Get the appropriate theme based on the current time of day.
+        Get the theme chosen for the time of the last update.
         """
-        current_hour = datetime.now().hour
-        return THEMES["dark"] if 18 <= current_hour or current_hour < 6 else THEMES["light"]  # Dark theme at night (6 PM - 6 AM), light theme during the day
+        return self._theme
     
     def draw(self, window):
         """
         Draw the analog clock on the window with the current time, date, and weather.
         """
-        theme = self.get_theme()  # Get the appropriate theme based on the time of day
-        window.fill(theme["background"])  # Set the background color
+        theme_name = self.get_theme_name()  # Get the appropriate theme based on the time of day
+        theme = self.get_theme()
+        window.fill(theme.background)  # Set the background color
         self.__draw_info_panel(window, theme)  # Draw the information panel (date and weather)
-        self.__draw_face(window, theme)  # Draw the clock face
-        self.__draw_hour_marks(window, theme)  # Draw the hour marks
-        self.__draw_hand(window, self.hour * 30 + self.minute * 0.5, self.size * 0.5, 8, theme["hand_hour"], True, theme)  # Draw the hour hand
-        self.__draw_hand(window, self.minute * 6, self.size * 0.7, 6, theme["hand_minute"], True, theme)  # Draw the minute hand
-        self.__draw_hand(window, self.second * 6, self.size * 0.9, 3, theme["hand_second"], True, theme)  # Draw the second hand
-        self.__draw_circle(window, self.position, 10, theme["face_outer"])  # Draw the center circle
+        face_surface = self.__get_face_surface(theme_name)  # Get the pre-rendered clock face and hour marks
+        window.blit(face_surface, face_surface.get_rect(center=self.position))  # Draw the clock face
+        self.__draw_hand(window, "hour", self.hour * 30 + self.minute * 0.5, self.size * 0.5, 8, theme.hand_hour, True, theme)  # Draw the hour hand
+        self.__draw_hand(window, "minute", self.minute * 6, self.size * 0.7, 6, theme.hand_minute, True, theme)  # Draw the minute hand
+        self.__draw_hand(window, "second", self.second * 6, self.size * 0.9, 3, theme.hand_second, True, theme)  # Draw the second hand
+        self.__draw_circle(window, self.position, 10, theme.face_outer)  # Draw the center circle
 
     def __draw_circle(self, window, position, size, color):
         """
@@ -108,47 +297,92 @@ class AnalogClock:
         pygame.gfxdraw.aacircle(window, position[0], position[1], size, color)  # Draw anti-aliased circle
         pygame.gfxdraw.filled_circle(window, position[0], position[1], size, color)  # Fill the circle
 
-    def __draw_face(self, window, theme):
+    def __get_face_surface(self, theme_name):
+        """
+        Get the clock face and hour marks for a theme, rendering them once and reusing the result.
+        """
+        if theme_name not in self._face_cache:
+            theme = THEMES[theme_name]
+            surface = pygame.Surface((self.size * 2 + 20, self.size * 2 + 20), pygame.SRCALPHA)  # Transparent surface a little larger than the face
+            center = (self.size + 10, self.size + 10)  # Clock center in surface coordinates
+            self.__draw_face(surface, center, theme)  # Draw the clock face
+            self.__draw_hour_marks(surface, center, theme)  # Draw the hour marks
+            self._face_cache[theme_name] = surface
+        return self._face_cache[theme_name]
+
+    def __draw_face(self, window, center, theme):
         """
         Draw the clock's outer, middle, and inner faces.
         """
-        self.__draw_circle(window, self.position, self.size, theme["face_outer"])  # Draw the outer face
-        self.__draw_circle(window, self.position, self.size - 30, theme["face_middle"])  # Draw the middle face
-        self.__draw_circle(window, self.position, self.size - 40, theme["face_inner"])  # Draw the inner face
+        self.__draw_circle(window, center, self.size, theme.face_outer)  # Draw the outer face
+        self.__draw_circle(window, center, self.size - 30, theme.face_middle)  # Draw the middle face
+        self.__draw_circle(window, center, self.size - 40, theme.face_inner)  # Draw the inner face
 
-    def __draw_hour_marks(self, window, theme):
+    def __draw_hour_marks(self, window, center, theme):
         """
         Draw the hour marks (12 hour positions) around the clock.
         """
-        for i in range(12):  # Draw 12 hour marks
-            angle = math.radians(i * 30)  # 30 degree angle per hour
-            x1 = self.position[0] + (self.size - 20) * math.cos(angle)  # X coordinate of the start point
-            y1 = self.position[1] - (self.size - 20) * math.sin(angle)  # Y coordinate of the start point
-            x2 = self.position[0] + (self.size - 40) * math.cos(angle)  # X coordinate of the end point
-            y2 = self.position[1] - (self.size - 40) * math.sin(angle)  # Y coordinate of the end point
-            pygame.draw.line(window, theme["mark_color"], (x1, y1), (x2, y2), 5)  # Draw the mark lines
+        cx, cy = center
+        for (dx1, dy1), (dx2, dy2) in self._hour_mark_offsets:  # Draw 12 hour marks
+            pygame.draw.line(window, theme.mark_color, (cx + dx1, cy + dy1), (cx + dx2, cy + dy2), 5)  # Draw the mark lines
+
+    def __get_hand_surfaces(self, hand_id, length, width, color, shadow_color):
+        """
+        Get the unrotated sprites of a hand and its shadow pointing at 12, building them once per theme.
+        """
+        key = (hand_id, color, shadow_color)
+        if key not in self._hand_surfaces:
+            length = int(length)
+            surface = pygame.Surface((width, length), pygame.SRCALPHA)  # Just the hand, drawn offset from the clock center
+            surface.fill(color)
+
+            pad = 2  # Room around the silhouette for the blur to spread into
+            shadow_size = (width + pad * 2, length + pad * 2)
+            shadow_surface = pygame.Surface(shadow_size, pygame.SRCALPHA)
+            shadow_surface.blit(surface, (pad, pad))  # Start from the hand's own silhouette
+            shadow_surface.fill((255, 255, 255, 0), special_flags=pygame.BLEND_RGBA_MAX)  # Whiten it, keeping its alpha
+            shadow_surface.fill(shadow_color, special_flags=pygame.BLEND_RGBA_MULT)  # Tint it with the translucent shadow color
+            small = pygame.transform.smoothscale(shadow_surface, (max(1, shadow_size[0] // 2), max(1, shadow_size[1] // 2)))
+            shadow_surface = pygame.transform.smoothscale(small, shadow_size)  # Scaling down and back up softens the edges
+
+            self._hand_surfaces[key] = (surface, shadow_surface)
+        return self._hand_surfaces[key]
 
-    def __draw_hand(self, window, angle, length, width, color, shadow, theme):
+    def __draw_hand(self, window, hand_id, angle, length, width, color, shadow, theme):
         """
         Draw the clock hands (hour, minute, second) with optional shadow.
         """
-        angle = math.radians(angle - 90)  # Convert the angle to radians and adjust for rotation
-        x = self.position[0] + length * math.cos(angle)  # X coordinate of the hand end
-        y = self.position[1] + length * math.sin(angle)  # Y coordinate of the hand end
-        
+        base, base_shadow = self.__get_hand_surfaces(hand_id, length, width, color, theme.shadow)
+        degrees = int(round(angle)) % 360  # Quantize to whole degrees
+        if hand_id == "second":  # The second hand moves every few frames, so caching its rotations would not pay off
+            rotated, rotated_shadow = pygame.transform.rotate(base, -degrees), pygame.transform.rotate(base_shadow, -degrees)  # pygame rotates counterclockwise, clock hands turn clockwise
+        else:
+            key = (hand_id, color, theme.shadow, degrees)  # Colors in the key keep both themes' rotations apart
+            if key in self._rot_cache:
+                self._rot_cache.move_to_end(key)  # Mark as recently used
+            else:
+                self._rot_cache[key] = (pygame.transform.rotate(base, -degrees), pygame.transform.rotate(base_shadow, -degrees))
+                if len(self._rot_cache) > ROTATION_CACHE_SIZE:
+                    self._rot_cache.popitem(last=False)  # Drop the least recently used rotation
+            rotated, rotated_shadow = self._rot_cache[key]
+
+        dx, dy = self._hand_directions[degrees]
+        center = (self.position[0] + dx * length / 2, self.position[1] + dy * length / 2)  # The sprite's center is halfway along the hand
         if shadow:  # If shadow is enabled
             shadow_offset = 5  # Offset for shadow positioning
-            shadow_x = self.position[0] + length * math.cos(angle) + shadow_offset  # Shadow X position
-            shadow_y = self.position[1] + length * math.sin(angle) + shadow_offset  # Shadow Y position
-            pygame.draw.line(window, theme["shadow"], (self.position[0] + shadow_offset, self.position[1] + shadow_offset), (shadow_x, shadow_y), width)  # Draw the shadow
-        
-        pygame.draw.line(window, color, self.position, (x, y), width)  # Draw the hand itself
+            window.blit(rotated_shadow, rotated_shadow.get_rect(center=center).move(shadow_offset, shadow_offset))  # Draw the shadow
+        window.blit(rotated, rotated.get_rect(center=center))  # Draw the hand itself
 
     def __draw_info_panel(self, window, theme):
         """
         Draw the date and weather information panel at the top of the window.
         """
-        info_surface = self.font.render(f"{self.current_date} | {self.weather}", True, theme["text_color"])  # Render the date and weather text
+        with self._weather_lock:
+            weather = self.weather  # Read the weather shared with the fetch thread
+        key = (self.current_date, weather, theme.text_color)
+        if key != self._info_cache[0]:  # Only re-render the text when it or its color changes
+            self._info_cache = (key, self.font.render(f"{self.current_date} | {weather}", True, theme.text_color))  # Render the date and weather text
+        info_surface = self._info_cache[1]
         info_rect = info_surface.get_rect(center=(self.position[0], 50))  # Position the info panel at the top of the window
         window.blit(info_surface, info_rect)  # Draw the info panel on the window
 
@@ -156,21 +390,54 @@ class AnalogClock:
 pygame.init()
 WINDOW_WIDTH = 600  # Set the width of the window
 WINDOW_HEIGHT = 600  # Set the height of the window
+WEATHER_CHECK_SEC = 60  # Check once a minute whether the cached weather has expired
 
-window = pygame.display.set_mode((WINDOW_WIDTH, WINDOW_HEIGHT))  # Create the game window
+try:
+    window = pygame.display.set_mode((WINDOW_WIDTH, WINDOW_HEIGHT), pygame.SCALED, vsync=1)  # Let the display driver pace frames
+except pygame.error:
+    window = pygame.display.set_mode((WINDOW_WIDTH, WINDOW_HEIGHT))  # Vsync unavailable, fall back to a plain window
 pygame.display.set_caption("Analog Clock")  # Set the window title
 
-clock = pygame.time.Clock()  # Create the clock object to control FPS
 analog_clock = AnalogClock(250, (300, 300))  # Create the analog clock with a size of 250px and center at (300, 300)
 
+async def render_loop():
+    """
+    Handle window events and redraw the clock until the window is closed.
+    """
+    last_frame_key = None  # Key of the last frame drawn, None forces a redraw
+    while True:
+        for event in pygame.event.get():  # Handle events like closing the window
+            if event.type == pygame.QUIT:
+                return  # Stop rendering if the window is closed
+            elif event.type == pygame.VIDEOEXPOSE:  # The window contents need repainting
+                last_frame_key = None
+
+        analog_clock.update()  # Update the clock time and weather
+        frame_key = analog_clock.get_frame_key()
+        if frame_key != last_frame_key:  # Skip drawing when nothing visible has changed
+            analog_clock.draw(window)  # Draw the clock on the window
+            pygame.display.update()  # Update the window display
+            last_frame_key = frame_key
+        await asyncio.sleep(analog_clock.get_seconds_until_next_frame())  # Sleep until the next visible change, letting other tasks run
+
+async def weather_loop():
+    """
+    Periodically refresh the weather alongside the render loop.
+    """
+    while True:
+        analog_clock.update_weather()  # Only fetches once the cached response has expired
+        await asyncio.sleep(WEATHER_CHECK_SEC)
+
+async def main():
+    """
+    Run the render and weather loops together until the window is closed.
+    """
+    weather_task = asyncio.create_task(weather_loop())
+    await render_loop()
+    weather_task.cancel()
+    with contextlib.suppress(asyncio.CancelledError):
+        await weather_task  # Let the weather loop finish cancelling before the event loop closes
+
 # Main Loop
-while True:
-    for event in pygame.event.get():  # Handle events like closing the window
-        if event.type == pygame.QUIT:
-            pygame.quit()  # Quit Pygame if the window is closed
-            exit()  # Exit the program
-    
-    analog_clock.update()  # Update the clock time and weather
-    analog_clock.draw(window)  # Draw the clock on the window
-    pygame.display.update()  # Update the window display
-    clock.tick(60)  # Limit the FPS to 60 for smooth animation
\ No newline at end of file
+asyncio.run(main())
+pygame.quit()  # Quit Pygame once the window is closed